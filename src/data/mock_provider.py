@@ -1,8 +1,27 @@
+import functools
+import unicodedata
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
 from src.data.interface import DataProvider
 from src.models.base import Match, Team, Player, PlayerPosition, PlayerStatus, NodeRole, MatchConditions
 
+
+@functools.lru_cache(maxsize=256)
+def _lnrm(name: str) -> str:
+    """
+    Canonical league key: parenthetical suffixes dropped, accents stripped,
+    casefolded. Applied at index-build time so the query path is one
+    normalization plus a dict hit ('La Liga (España)' -> 'la liga').
+    Cached: callers query with the same handful of (interned) UI literals,
+    so repeat lookups skip the Unicode walk entirely.
+    """
+    s = str(name)
+    if "(" in s:
+        s = s.split("(")[0]
+    s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore').decode()
+    return s.strip().casefold()
+
+
 class MockDataProvider(DataProvider):
     """
     Provides dummy data for testing the UI and Logic flow.
@@ -11,6 +30,33 @@ class MockDataProvider(DataProvider):
     
     def __init__(self):
         self.teams_db = self._init_teams()
+        # Generated dummy teams, cached so repeated lookups for an unknown
+        # name return the same roster instead of re-rolling random players
+        # (kept out of teams_db so league listings stay clean)
+        self._dummy_cache: Dict[str, Team] = {}
+        # normalized league key -> team names. The grouping pass is the only
+        # incremental build; every derived structure below is constructed in
+        # one shot at its final size (CPython doesn't expose dict
+        # pre-allocation, so single-shot construction from known data is the
+        # closest equivalent — no half-filled containers get resized later).
+        grouped: Dict[str, List[str]] = {}
+        for name, team in self.teams_db.items():
+            grouped.setdefault(_lnrm(team.league), []).append(name)
+        self._league_index: Dict[str, List[str]] = grouped
+        # frozenset twin of the index for O(1) membership checks, built
+        # directly from the final per-league lists
+        self._league_sets: Dict[str, frozenset] = {
+            key: frozenset(names) for key, names in grouped.items()
+        }
+        self._all_teams_sorted = sorted(self.teams_db)
+        self._all_teams_set = frozenset(self.teams_db)
+        # inverse index: team -> normalized league keys, for O(1)
+        # "does team X play in league Y" checks (frozenset-valued so a team
+        # can belong to several listings if that ever happens)
+        self._team_to_leagues: Dict[str, frozenset] = {
+            name: frozenset((_lnrm(team.league),))
+            for name, team in self.teams_db.items()
+        }
 
     def get_upcoming_matches(self, league: str) -> List[Match]:
         # Legacy support, though UI is moving to builder
@@ -19,24 +65,110 @@ class MockDataProvider(DataProvider):
     def get_teams_by_league(self, league: str) -> List[str]:
         if not league:
             return []
-            
+
         # Handle Liga Mixta (Combinada) - Return all available teams
         # We check for 'mixta' or 'combinada' to be very robust
         search_term = str(league).lower()
         if "mixta" in search_term or "combinada" in search_term:
-            return sorted(list(self.teams_db.keys()))
-            
-        # Robust filtering: case-insensitive and stripped
-        target = league.strip().lower()
-        if "(" in target:
-            target = target.split("(")[0].strip()
-            
-        return [name for name, team in self.teams_db.items() if (team.league.strip().lower() == target or target in team.league.strip().lower())]
+            return self._all_teams_sorted
+
+        # Robust filtering: same normalization the index keys were built with
+        target = _lnrm(league)
+
+        # O(1) hit on the prebuilt index for exact league names; substring
+        # matching over the handful of index keys only as a fallback
+        # Cached list returned as-is (ordered consumers, no per-call copy)
+        exact = self._league_index.get(target)
+        if exact is not None:
+            return exact
+
+        matches = []
+        for key, names in self._league_index.items():
+            if target in key:
+                matches.extend(names)
+        return matches
+
+    def get_teams_by_leagues(self, names) -> Dict[str, List[str]]:
+        """
+        Batch variant of get_teams_by_league: normalizes every requested
+        name once, dedupes identical canonical keys and gathers from the
+        index in one pass. Returns {original name: teams}.
+        """
+        results: Dict[str, List[str]] = {}
+        gathered: Dict[str, List[str]] = {}
+        for name in names:
+            key = _lnrm(name)
+            if key not in gathered:
+                gathered[key] = self.get_teams_by_league(name)
+            results[name] = gathered[key]
+        return results
+
+    def iter_teams_by_league(self, league: str):
+        """
+        Lazy variant of get_teams_by_league for callers that only consume a
+        prefix (count-until-threshold, sampling): yields straight from the
+        cached structures without materializing merged result lists.
+        """
+        if not league:
+            return
+
+        search_term = str(league).lower()
+        if "mixta" in search_term or "combinada" in search_term:
+            yield from self._all_teams_sorted
+            return
+
+        target = _lnrm(league)
+        exact = self._league_index.get(target)
+        if exact is not None:
+            yield from exact
+            return
+
+        for key, names in self._league_index.items():
+            if target in key:
+                yield from names
+
+    def get_team_set_by_league(self, league: str) -> frozenset:
+        """Like get_teams_by_league but returns a cached frozenset, for
+        callers doing membership checks instead of ordered listings."""
+        if not league:
+            return frozenset()
+
+        search_term = str(league).lower()
+        if "mixta" in search_term or "combinada" in search_term:
+            return self._all_teams_set
+
+        target = _lnrm(league)
+        exact = self._league_sets.get(target)
+        if exact is not None:
+            return exact
+
+        matches = frozenset()
+        for key, names in self._league_sets.items():
+            if target in key:
+                matches |= names
+        return matches
+
+    def has_team_in_league(self, team_name: str, league: str) -> bool:
+        """O(1) membership check against the inverse team->leagues index."""
+        if not team_name or not league:
+            return False
+
+        search_term = str(league).lower()
+        if "mixta" in search_term or "combinada" in search_term:
+            return team_name in self._all_teams_set
+
+        return _lnrm(league) in self._team_to_leagues.get(team_name, ())
 
     def get_team_data(self, team_name: str) -> Team:
         if not team_name:
             team_name = "Equipo Desconocido"
-        return self.teams_db.get(team_name, self._create_dummy_team(team_name))
+        team = self.teams_db.get(team_name)
+        if team is None:
+            team = self._dummy_cache.get(team_name)
+            if team is None:
+                team = self._create_dummy_team(team_name)
+                self._dummy_cache[team_name] = team
+        return team
 
     def get_match_conditions(self, match_id: str, location: str, date_time: str) -> Optional[dict]:
         return {"temp": 20, "rain": 0}
@@ -20,6 +20,18 @@ HEADERS = {
     'Accept-Language': 'es-ES,es;q=0.9,en;q=0.8',
 }
 
+# Precompiled tag/class matchers (otherwise rebuilt on every scrape call)
+_MATCH_CARD_CLASS = re.compile(r'partido|match|encuen|card', re.I)
+_LINEUP_SECTION_CLASS = re.compile(r'equipo|alineacion|lineup|once', re.I)
+_PLAYER_EL_CLASS = re.compile(r'jugador|player|nombre|player-name', re.I)
+_PLAYER_NAME_CLASS = re.compile(r'jugador|nombre|player', re.I)
+_BAJA_CLASS = re.compile(r'baja|lesion|duda|out|unavail|blesur', re.I)
+_LINEUP_TABLE_CLASS = re.compile(r'tabla.*desc-partido|alineacion', re.I)
+_REF_EL_CLASS = re.compile(r'referee|arbitro|juez', re.I)
+_ARBITRO_STRING = re.compile(r'(?i)arbitro|árbitro')
+_ARBITRO_PREFIX = re.compile(r'[Áá]rbitro:?\s*')
+_REF_PREFIX = re.compile(r'[Áá]rbitro:?\s*|Referee:?\s*')
+
 # Referee pool as last resort
 LALIGA_REFEREE_POOL = [
     {'name': 'Jesús Gil Manzano', 'avg_cards': 5.8},
@@ -85,7 +97,7 @@ def _find_futbolfantasy_match_url(home: str, away: str) -> Optional[str]:
                     return href if href.startswith('http') else f"https://www.futbolfantasy.com{href}"
 
         # Strategy 3: scan parent containers (match cards)
-        for card in soup.find_all(['div', 'article'], class_=re.compile(r'partido|match|encuen|card', re.I)):
+        for card in soup.find_all(['div', 'article'], class_=_MATCH_CARD_CLASS):
             card_text = card.get_text(separator=' ').lower()
             if home_short in card_text and away_short in card_text:
                 link = card.find('a', href=True)
@@ -141,7 +153,7 @@ def fetch_lineup_futbolfantasy(home: str, away: str) -> Dict:
 
         # --- Extract lineups ---
         # FutbolFantasy structure: two .equipo or .alineacion divs
-        team_sections = soup.find_all(['div', 'section'], class_=re.compile(r'equipo|alineacion|lineup|once', re.I))
+        team_sections = soup.find_all(['div', 'section'], class_=_LINEUP_SECTION_CLASS)
 
         home_players = []
         away_players = []
@@ -149,7 +161,7 @@ def fetch_lineup_futbolfantasy(home: str, away: str) -> Dict:
         if len(team_sections) >= 2:
             for i, section in enumerate(team_sections[:2]):
                 players = []
-                for el in section.find_all(class_=re.compile(r'jugador|player|nombre|player-name', re.I)):
+                for el in section.find_all(class_=_PLAYER_EL_CLASS):
                     name = el.get_text(separator=' ').strip()
                     if name and 2 <= len(name.split()) <= 5:
                         players.append(name)
@@ -166,15 +178,15 @@ def fetch_lineup_futbolfantasy(home: str, away: str) -> Dict:
                 if home.lower()[:6] in h_text:
                     sibling = h.find_next_sibling()
                     if sibling:
-                        home_players = [el.get_text().strip() for el in sibling.find_all(class_=re.compile(r'jugador|nombre|player', re.I))][:11]
+                        home_players = [el.get_text().strip() for el in sibling.find_all(class_=_PLAYER_NAME_CLASS)][:11]
                 elif away.lower()[:6] in h_text:
                     sibling = h.find_next_sibling()
                     if sibling:
-                        away_players = [el.get_text().strip() for el in sibling.find_all(class_=re.compile(r'jugador|nombre|player', re.I))][:11]
+                        away_players = [el.get_text().strip() for el in sibling.find_all(class_=_PLAYER_NAME_CLASS)][:11]
 
         # --- Extract bajas (injuries/unavailable) ---
         bajas = []
-        for el in soup.find_all(class_=re.compile(r'baja|lesion|duda|out|unavail|blesur', re.I)):
+        for el in soup.find_all(class_=_BAJA_CLASS):
             name = el.get_text(separator=' ').strip()
             if name and 2 <= len(name.split()) <= 5:
                 bajas.append(name)
@@ -249,7 +261,7 @@ def fetch_lineup_rf(home: str, away: str) -> Dict:
         soup2 = BeautifulSoup(l_html, 'html.parser')
         
         # Based on browser research: table.tabla.desc-partido
-        table = soup2.find('table', class_=re.compile(r'tabla.*desc-partido|alineacion', re.I))
+        table = soup2.find('table', class_=_LINEUP_TABLE_CLASS)
         if table:
             home_players = [a.get_text().strip() for a in table.select('td.equipo1 a')]
             away_players = [a.get_text().strip() for a in table.select('td.equipo2 a')]
@@ -297,7 +309,7 @@ def fetch_referee_futbolfantasy(home: str, away: str) -> Optional[Dict]:
         if div:
             span = div.find('span', class_='link') or div.find('a') or div
             name = span.get_text().strip()
-            name = re.sub(r'[Áá]rbitro:?\s*', '', name).strip()
+            name = _ARBITRO_PREFIX.sub('', name).strip()
             if len(name.split()) >= 2:
                 return {'name': name, 'source': 'FutbolFantasy', 'verification_link': match_url}
 
@@ -305,7 +317,7 @@ def fetch_referee_futbolfantasy(home: str, away: str) -> Optional[Dict]:
         page_text = soup.get_text(separator='\n')
         for line in page_text.split('\n'):
             if 'árbitro' in line.lower() or 'arbitro' in line.lower():
-                name = re.sub(r'[Áá]rbitro:?\s*', '', line).strip()
+                name = _ARBITRO_PREFIX.sub('', line).strip()
                 if 2 <= len(name.split()) <= 4:
                     return {'name': name, 'source': 'FutbolFantasy (text)', 'verification_link': match_url}
     except Exception as e:
@@ -359,7 +371,7 @@ def fetch_referee_rf(home: str, away: str) -> Optional[Dict]:
             
         soup2 = BeautifulSoup(m_html, 'html.parser')
         
-        for rt in soup2.find_all(string=re.compile(r'(?i)arbitro|árbitro')):
+        for rt in soup2.find_all(string=_ARBITRO_STRING):
             text = rt.parent.parent.get_text(separator=' ', strip=True)
             if 'principal' in text.lower():
                 name_part = text.split('principal')[-1].strip()
@@ -415,7 +427,7 @@ def fetch_referee_besoccer(home: str, away: str) -> Optional[Dict]:
         soup = BeautifulSoup(resp.text, 'html.parser')
 
         # BeSoccer wraps referee in .referee-name or similar
-        for el in soup.find_all(class_=re.compile(r'referee|arbitro|juez', re.I)):
+        for el in soup.find_all(class_=_REF_EL_CLASS):
             name = el.get_text().strip()
             if 2 <= len(name.split()) <= 4:
                 return {'name': name, 'source': 'BeSoccer', 'verification_link': search_url}
@@ -424,7 +436,7 @@ def fetch_referee_besoccer(home: str, away: str) -> Optional[Dict]:
         text = soup.get_text(separator='\n')
         for line in text.split('\n'):
             if 'árbitro' in line.lower() or 'referee' in line.lower():
-                name = re.sub(r'[Áá]rbitro:?\s*|Referee:?\s*', '', line).strip()
+                name = _REF_PREFIX.sub('', line).strip()
                 if 2 <= len(name.split()) <= 4:
                     return {'name': name, 'source': 'BeSoccer', 'verification_link': search_url}
 
@@ -1,11 +1,73 @@
 from typing import List, Dict
+import io
+import re
 import time
+import unicodedata
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from src.data.interface import DataProvider
+from src.models.base import RefereeStrictness
 from src.data.auto_lineup_fetcher import AutoLineupFetcher
 from src.data.referee_source_mapper import RefereeSourceMapper
 from src.data.multi_source_fetcher import MultiSourceFetcher
 
+# Prefer the lxml parser backend for BeautifulSoup (C parser, ~3-10x faster
+# than the pure-Python html.parser); degrade gracefully if not installed.
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = 'lxml'
+except ImportError:
+    BS4_PARSER = 'html.parser'
+
+# Precompiled name-extraction patterns (shared by URL scraping and OCR)
+_NAME_TOKEN_RE = re.compile(r'>\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)\s*<')
+# Horizontal whitespace only, so one pass over the whole OCR text cannot
+# join names that sit on different lines
+_OCR_ANY_RE = re.compile(r'([A-Z][a-z\u00C0-\u017F]+(?:[ \t][A-Z][a-z\u00C0-\u017F]+)+)')
+_OCR_WORD_RE = re.compile(r'\b[A-Z][a-z\u00C0-\u017F]+\b')
+
+# Lineup pages fit comfortably in this budget; anything bigger is ads or
+# embedded JSON the extraction strategies never look at
+_HTML_BYTE_CAP = 512 * 1024
+
+# Two full squads plus noise fit well inside this; anything more multiplies
+# the fuzzy-match cost for candidates that can't all be players anyway
+_MAX_CANDIDATES = 200
+
+_INITIAL_PREFIX_RE = re.compile(r'^[A-Z]\.\s*')
+
+
+def _normalize_name(s: str) -> str:
+    """
+    Canonical form for fuzzy matching: strip accents, collapse whitespace and
+    drop single-initial prefixes so 'L. Messi', 'Lionel  Messi' and accented
+    variants dedupe to one candidate. Roster tokens are normalized the same
+    way, so the match still returns the original human-readable roster name.
+    """
+    s = _INITIAL_PREFIX_RE.sub('', s.strip())
+    s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore').decode()
+    return ' '.join(s.split())
+
+
+# pytesseract/PIL are heavy and only needed by the OCR path; load them once
+# on first use instead of at module import (or per call)
+_ocr_modules = None
+
+
+def _get_ocr_modules():
+    global _ocr_modules
+    if _ocr_modules is None:
+        import pytesseract
+        from PIL import Image, ImageOps
+        _ocr_modules = (pytesseract, Image, ImageOps)
+    return _ocr_modules
+
 class LineupFetcher:
     """
     Fetches official lineups and referee data from elite multi-source pipeline.
@@ -20,18 +82,123 @@ class LineupFetcher:
         self.data_provider = data_provider
         self.auto_fetcher = AutoLineupFetcher(data_provider)
         self.ms_fetcher = MultiSourceFetcher()
+        # league -> (monotonic timestamp, injuries dict); see fetch_injuries
+        self._injury_cache: Dict[str, tuple] = {}
+        # team name -> (Team, token index); see _get_roster_tokens
+        self._roster_cache: Dict[str, tuple] = {}
+        # (home, away, iso datetime, league) -> (ts, result); the UI re-renders
+        # a match several times per session, so repeat calls within 5 min are
+        # answered from memory instead of re-running the scrape cascade
+        self._lineup_cache: Dict[tuple, tuple] = {}
+        self._ref_cache: Dict[tuple, tuple] = {}
+        # pooled requests.Session, created on first scrape (see _get_session)
+        self._session = None
+        self._headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+    def _get_session(self):
+        """
+        Lazily builds a pooled requests.Session (keep-alive + retries) so the
+        main page and AJAX follow-up reuse one connection per host.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                  max_retries=Retry(total=2, backoff_factor=0.3,
+                                                    status_forcelist=[502, 503, 504]))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(self._headers)
+            self._session = session
+        return self._session
+
+    @staticmethod
+    def _read_capped(resp) -> str:
+        """Streams at most _HTML_BYTE_CAP bytes of a response body."""
+        raw = b''
+        for piece in resp.iter_content(chunk_size=65536):
+            raw += piece
+            if len(raw) >= _HTML_BYTE_CAP:
+                break
+        resp.close()
+        return raw.decode(resp.encoding or 'utf-8', errors='replace')
+
+    @staticmethod
+    def _build_token_index(roster) -> dict:
+        """
+        Pre-tokenizes a roster: a frozenset per player for the subset tests
+        plus the union of all tokens for a cheap disjoint precheck.
+        """
+        token_sets = [(frozenset(_normalize_name(p.name).lower().split()), p.name) for p in roster]
+        all_tokens = frozenset().union(*(ts for ts, _ in token_sets)) if token_sets else frozenset()
+        return {'sets': token_sets, 'all': all_tokens}
+
+    @staticmethod
+    def _fuzzy_match(scraped_tokens: list, index: dict):
+        """
+        Subset-based roster match: a player matches when his tokens contain
+        (or are contained by) the scraped tokens — 'Aspas' still finds
+        'Iago Aspas'. Ties are scored by overlap size. The old
+        any-shared-token branch returned the first player sharing noise
+        words like 'de' and made later roster entries unreachable, so it is
+        gone; names sharing no token with the roster bail out on the union
+        precheck without touching the per-player sets.
+        """
+        scraped_set = frozenset(scraped_tokens)
+        if not scraped_set or scraped_set.isdisjoint(index['all']):
+            return None
+
+        best, best_score = None, 0
+        for p_tokens, name in index['sets']:
+            if p_tokens <= scraped_set or scraped_set <= p_tokens:
+                score = len(p_tokens & scraped_set)
+                if score > best_score:
+                    best, best_score = name, score
+        return best
+
+    def _get_roster_tokens(self, team_name: str) -> tuple:
+        """
+        Memoized (Team, token index) pair so repeated scrapes for the same
+        team skip the data-provider round-trip and re-tokenization.
+        """
+        cached = self._roster_cache.get(team_name)
+        if cached is None:
+            team = self.data_provider.get_team_data(team_name)
+            index = self._build_token_index(team.players if team else [])
+            cached = (team, index)
+            self._roster_cache[team_name] = cached
+        return cached
+
+    # One slow upstream source must not stall the whole fetch: multi-source
+    # calls are capped at this many seconds, after which the caller's
+    # fallback path (internal DB / pool) takes over immediately.
+    MS_FETCH_CAP = 12.0
+
+    def _call_ms_capped(self, fn, *args, timeout_result: Dict) -> Dict:
+        """
+        Runs a MultiSourceFetcher call on a worker thread with a hard wall
+        time. On timeout the worker keeps running in the background (requests
+        can't be interrupted) but the caller proceeds with timeout_result.
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fn, *args)
+        try:
+            return future.result(timeout=self.MS_FETCH_CAP)
+        except FuturesTimeoutError:
+            print(f"  !! MultiSource sin respuesta en {self.MS_FETCH_CAP:.0f}s — usando fallback")
+            return timeout_result
+        finally:
+            executor.shutdown(wait=False)
 
     def fetch_confirmed_lineup(self, team_name: str, match_time: str) -> List[str]:
         """
-        Simulates network call to get confirmed lineup 1 hour before match_time.
-        Returns list of player names.
+        Returns the confirmed lineup 1 hour before match_time as a list of
+        player names. Answers straight from the internal DB — no blocking
+        wait, safe to call from a request worker.
         """
         print(f"[*] Checking lineups 1 hour before {match_time}...")
-        # Simulate Network Latency
-        time.sleep(1.0) 
-        
+
         # In this demo, we assume our internal DB has the ground truth for confirmed lineups
-        team = self.data_provider.get_team_data(team_name)
+        team, _ = self._get_roster_tokens(team_name)
         return [p.name for p in team.players[:11]]
 
     def fetch_smart_lineup(self, home_team_name: str, away_team_name: str, match_datetime: datetime, league: str) -> Dict:
@@ -40,7 +207,35 @@ class LineupFetcher:
         - Always tries elite/official sources first (MultiSourceFetcher)
         - Falls back to internal DB (last match) if all web sources fail
         - Exposes 'bajas_detectadas' for BPA penalization
+        Results are memoized for 5 minutes per (teams, kickoff, league).
+        """
+        key = (home_team_name, away_team_name, match_datetime.isoformat(), league)
+        cached = self._lineup_cache.get(key)
+        if cached and time.monotonic() - cached[0] < 300:
+            return dict(cached[1])
+
+        result = self._fetch_smart_lineup_uncached(home_team_name, away_team_name, match_datetime, league)
+        self._lineup_cache[key] = (time.monotonic(), result)
+        return result
+
+    def fetch_smart_lineups_batch(self, matches: List) -> Dict[str, Dict]:
+        """
+        Fetches lineups for a whole matchday concurrently instead of
+        serializing one network cascade per match. Takes Match objects and
+        returns {match id: fetch_smart_lineup result}; results also land in
+        the per-match TTL cache, so later single-match calls are free.
         """
+        if not matches:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(10, len(matches))) as ex:
+            futures = {
+                ex.submit(self.fetch_smart_lineup, m.home_team.name,
+                          m.away_team.name, m.date, m.competition): m.id
+                for m in matches
+            }
+            return {futures[f]: f.result() for f in as_completed(futures)}
+
+    def _fetch_smart_lineup_uncached(self, home_team_name: str, away_team_name: str, match_datetime: datetime, league: str) -> Dict:
         now = datetime.now()
         time_until_match = match_datetime - now
         hours_until_match = time_until_match.total_seconds() / 3600
@@ -49,7 +244,10 @@ class LineupFetcher:
             # Before 1h window: try multi-source for advance lineups, 
             # then fall back to internal DB if nothing found
             print(f"INFO: Fetching advance lineup data via MultiSourceFetcher...")
-            ms_result = self.ms_fetcher.fetch_lineup(home_team_name, away_team_name, match_datetime, league)
+            ms_result = self._call_ms_capped(
+                self.ms_fetcher.fetch_lineup, home_team_name, away_team_name, match_datetime, league,
+                timeout_result={'home': [], 'away': [], 'bajas': [],
+                                'source': 'Timeout MultiSource', '_is_fallback': True})
             
             if ms_result.get('home') or ms_result.get('away'):
                 return {
@@ -79,7 +277,10 @@ class LineupFetcher:
         else:
             # Within 1h: prioritize multi-source then auto-fetcher
             print(f"FETCH: Dentro de 1h. Obteniendo alineaciones oficiales para {league}...")
-            ms_result = self.ms_fetcher.fetch_lineup(home_team_name, away_team_name, match_datetime, league)
+            ms_result = self._call_ms_capped(
+                self.ms_fetcher.fetch_lineup, home_team_name, away_team_name, match_datetime, league,
+                timeout_result={'home': [], 'away': [], 'bajas': [],
+                                'source': 'Timeout MultiSource', '_is_fallback': True})
             
             if ms_result.get('home') or ms_result.get('away'):
                 ms_result['is_official'] = True
@@ -113,11 +314,21 @@ class LineupFetcher:
         Fetches the assigned referee via multi-source pipeline.
         Cascade per league: Elite Source → Official Committee → BeSoccer → Fallback Pool
         Always returns verification_link and _is_fallback flag.
+        Memoized for 5 minutes per (teams, date, league).
         """
+        key = (home_team, away_team, match_date.isoformat(), league)
+        cached = self._ref_cache.get(key)
+        if cached and time.monotonic() - cached[0] < 300:
+            return dict(cached[1])
+
         print(f"[MultiSource] Buscando árbitro para {league}: {home_team} vs {away_team}")
         
         # Primary: MultiSourceFetcher (cascades elite → official → fallback)
-        result = self.ms_fetcher.fetch_referee(home_team, away_team, match_date, league)
+        result = self._call_ms_capped(
+            self.ms_fetcher.fetch_referee, home_team, away_team, match_date, league,
+            timeout_result={'name': 'Por Detectar', 'strictness': RefereeStrictness.MEDIUM,
+                            'avg_cards': 4.5, 'source': 'Timeout MultiSource',
+                            'verification_link': None, '_is_fallback': True})
         
         # If fallback used, also try old RefereeSourceMapper as secondary
         if result.get('_is_fallback'):
@@ -132,57 +343,90 @@ class LineupFetcher:
         
         flag = "[POOL-FALLBACK]" if result.get('_is_fallback') else "[VERIFICADO]"
         print(f"  {flag} Árbitro: {result['name']} | Fuente: {result.get('source', 'Unknown')}")
-        
+
+        self._ref_cache[key] = (time.monotonic(), result)
         return result
 
     def fetch_injuries(self, league: str) -> Dict:
-        """Fetch injury report for a league."""
-        return self.auto_fetcher.fetch_injuries_auto(league)
+        """Fetch injury report for a league. Cached for 30s per league so
+        repeated calls within one analysis don't re-hit the scraper."""
+        now = time.monotonic()
+        cached = self._injury_cache.get(league)
+        if cached and now - cached[0] < 30:
+            return cached[1]
+
+        result = self.auto_fetcher.fetch_injuries_auto(league)
+        self._injury_cache[league] = (now, result)
+        return result
+
+    @staticmethod
+    def _collect_nodes(soup):
+        """
+        One pass over the (strained) tree collecting every node the
+        extraction strategies need, instead of five separate traversals.
+        """
+        title, rows, anchors, imgs, spans = "", [], [], [], []
+        for el in soup.descendants:
+            name = getattr(el, 'name', None)
+            if name is None:
+                continue
+            if name == 'a':
+                if el.has_attr('href'):
+                    anchors.append(el)
+            elif name == 'img':
+                if el.has_attr('alt'):
+                    imgs.append(el)
+            elif name == 'span':
+                if 'player-name' in (el.get('class') or ()):
+                    spans.append(el)
+            elif name == 'title' and not title:
+                title = el.string or ""
+            if 'lineup-row' in (el.get('class') or ()):
+                rows.append(el)
+        return title, rows, anchors, imgs, spans
 
     def fetch_from_url(self, url: str, home_team_name: str, away_team_name: str) -> dict:
         """
         Scrapes a sports site for lineups using requests and BeautifulSoup.
         """
-        import requests
-        from bs4 import BeautifulSoup
-        import re
-        
         print(f"📡 Accessing: {url} ...")
-        
+
         extracted_names = set()
-        
+
+        # Only these tags feed the extraction strategies below; skipping the
+        # rest of the DOM roughly halves parse CPU/memory on big pages.
+        strainer = SoupStrainer(['a', 'img', 'span', 'title', 'div'])
+
         try:
-            # 1. Fetch Content
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-            resp = requests.get(url, headers=headers, timeout=10)
+            # 1. Fetch Content (pooled session: AJAX follow-up reuses the socket)
+            session = self._get_session()
+            resp = session.get(url, timeout=10, stream=True)
             resp.raise_for_status()
-            html = resp.text
-            soup = BeautifulSoup(html, 'html.parser')
-            
+            html = self._read_capped(resp)
+            soup = BeautifulSoup(html, BS4_PARSER, parse_only=strainer)
+            page_title, rows, anchors, imgs, spans = self._collect_nodes(soup)
+
             # --- FIX: Handle Redirect to Main Page / Multiple Matches ---
             # If we are on the main lineups page, we need to find the specific match ID and fetch via AJAX
-            page_title = soup.title.string if soup.title else ""
-            if "Football Lineups" in page_title or len(soup.find_all(class_='lineup-row')) > 5:
+
+            # Normalize names for search (simple check)
+            home_simple = home_team_name.split()[0] if home_team_name else ""
+            away_simple = away_team_name.split()[0] if away_team_name else ""
+
+            # A match-specific page names both teams in its title — skip the
+            # main-page row scan entirely in that case.
+            on_match_page = bool(home_simple and away_simple
+                                 and home_simple in page_title and away_simple in page_title)
+
+            if on_match_page:
+                rows = []
+            if not on_match_page and ("Football Lineups" in page_title or len(rows) > 5):
                 print(f"  ⚠️ Redirected to main page. Searching for match: {home_team_name} vs {away_team_name}...")
-                
-                # Normalize names for search (simple check)
-                home_simple = home_team_name.split()[0] if home_team_name else ""
-                away_simple = away_team_name.split()[0] if away_team_name else ""
-                
+
                 # Find the match container
                 # We look for a container that has both team names
                 found_id = None
-                
-                # Regex search in HTML to be robust
-                # Look for home team, then away team (or vice-versa), then reply_click
-                # This is a bit expensive but robust
-                import re
-                
-                # Pattern: Team1 ... Team2 ... reply_click(ID) (or Team2 ... Team1)
-                # We limit the distance to avoid false positives from different matches
-                
-                # Try finding the row first
-                rows = soup.find_all(class_='lineup-row')
+
                 for row in rows:
                     row_text = row.get_text()
                     if home_simple in row_text and away_simple in row_text:
@@ -196,10 +440,11 @@ class LineupFetcher:
                 if found_id:
                     ajax_url = f"https://www.sportsgambler.com/lineups/lineups-load2.php?id={found_id}"
                     print(f"  🔄 Fetching AJAX content: {ajax_url}")
-                    resp_ajax = requests.get(ajax_url, headers=headers, timeout=10)
+                    resp_ajax = session.get(ajax_url, timeout=10, stream=True)
                     if resp_ajax.status_code == 200:
-                        html = resp_ajax.text
-                        soup = BeautifulSoup(html, 'html.parser')
+                        html = self._read_capped(resp_ajax)
+                        soup = BeautifulSoup(html, BS4_PARSER, parse_only=strainer)
+                        _, _, anchors, imgs, spans = self._collect_nodes(soup)
                     else:
                         print(f"  ❌ AJAX fetch failed: {resp_ajax.status_code}")
                 else:
@@ -208,7 +453,9 @@ class LineupFetcher:
             # 2. Extract Names (Multiple Strategies)
             
             # Strategy A: Links containing 'jugadores/' or 'player/' (Updated for AJAX content)
-            for a in soup.find_all('a', href=True):
+            for a in anchors:
+                if len(extracted_names) >= _MAX_CANDIDATES:
+                    break
                 href = a['href'].lower()
                 if 'jugadores/' in href or 'player/' in href:
                     # Try text first, then slug
@@ -221,26 +468,33 @@ class LineupFetcher:
                             extracted_names.add(slug)
 
             # Strategy B: Images with alt tags (common in lineup grids)
-            for img in soup.find_all('img', alt=True):
+            for img in imgs:
+                if len(extracted_names) >= _MAX_CANDIDATES:
+                    break
                 alt = img['alt'].strip()
                 if alt and len(alt.split()) > 1:
                     # Filter out non-player info
                     if not any(x in alt.lower() for x in ["escudo", "logo", "estadio", "entrenador"]):
                         extracted_names.add(alt)
 
-            # Strategy C: Raw text with regex (Fallback)
-            # Find names like "Iago Aspas", "L. Messi"
-            # This is risky but can work if scraping fails
-            raw_regex = re.findall(r'>\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)\s*<', html)
-            for name in raw_regex:
-                extracted_names.add(name)
-
             # Strategy D: Spans with class 'player-name' (Common in AJAX loaded lineups)
-            for span in soup.find_all('span', class_='player-name'):
+            for span in spans:
+                if len(extracted_names) >= _MAX_CANDIDATES:
+                    break
                 name = span.get_text().strip()
                 if name and len(name.split()) > 1:
                     extracted_names.add(name)
 
+            # Strategy C: Raw text with regex — kept as a true fallback.
+            # The backtracking sweep over the whole document is the most
+            # expensive and noisiest strategy, so it only runs when the
+            # targeted DOM strategies found fewer candidates than two XIs.
+            if len(extracted_names) < 22:
+                for name in _NAME_TOKEN_RE.findall(html):
+                    if len(extracted_names) >= _MAX_CANDIDATES:
+                        break
+                    extracted_names.add(name)
+
         except Exception as e:
             return {"error": f"Scraping failed: {str(e)}", "home": [], "away": []}
 
@@ -248,38 +502,27 @@ class LineupFetcher:
         found_home = []
         found_away = []
         
-        team_home = self.data_provider.get_team_data(home_team_name)
-        team_away = self.data_provider.get_team_data(away_team_name)
-        
-        def fuzzy_match(scraped_name, roster):
-            # Token-based match with high precision
-            scraped_tokens = set(scraped_name.lower().split())
-            if not scraped_tokens: return None
-            
-            for p in roster:
-                p_tokens = set(p.name.lower().split())
-                # If all tokens of the roster name are in the scraped name, or vice versa
-                if p_tokens.issubset(scraped_tokens) or scraped_tokens.issubset(p_tokens):
-                    return p.name
-                # Partial match (e.g. "Aspas" match "Iago Aspas")
-                if len(scraped_tokens.intersection(p_tokens)) >= 1:
-                    # Extra check for common surnames
-                    return p.name
-            return None
+        team_home, home_idx = self._get_roster_tokens(home_team_name)
+        team_away, away_idx = self._get_roster_tokens(away_team_name)
 
-        # Process Home
-        if team_home:
-            for scraped in extracted_names:
-                match = fuzzy_match(scraped, team_home.players)
+        # Normalize + dedupe near-duplicate candidates, tokenize each one
+        # once, then run one combined pass that stops as soon as both
+        # starting XIs are filled (OCR pages can emit 40-80 noisy strings)
+        normalized = {_normalize_name(name) for name in extracted_names if len(name) > 2}
+        normalized.discard('')
+        scraped_tokens = [name.lower().split() for name in normalized]
+
+        for tokens in scraped_tokens:
+            if team_home and len(found_home) < 11:
+                match = self._fuzzy_match(tokens, home_idx)
                 if match and match not in found_home:
                     found_home.append(match)
-                    
-        # Process Away
-        if team_away:
-            for scraped in extracted_names:
-                match = fuzzy_match(scraped, team_away.players)
+            if team_away and len(found_away) < 11:
+                match = self._fuzzy_match(tokens, away_idx)
                 if match and match not in found_away:
                     found_away.append(match)
+            if len(found_home) >= 11 and len(found_away) >= 11:
+                break
         
         # 4. Result Verification
         if not found_home and not found_away:
@@ -294,42 +537,53 @@ class LineupFetcher:
             "count": len(found_home) + len(found_away)
         }
 
+    def fetch_from_urls(self, jobs: List[tuple]) -> List[dict]:
+        """
+        Runs several fetch_from_url scrapes concurrently for a matchday batch.
+        jobs is a list of (url, home_team_name, away_team_name) tuples;
+        results keep job order. Concurrency is capped at 8 — requests
+        releases the GIL during I/O, so N back-to-back scrapes collapse to
+        roughly the slowest round-trip instead of the sum of all of them.
+        """
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as ex:
+            return list(ex.map(lambda job: self.fetch_from_url(*job), jobs))
+
     def extract_from_image(self, image_bytes: bytes, home_team_name: str, away_team_name: str) -> dict:
         """
         Processes an image (bytes) to extract player names using OCR.
         """
-        import pytesseract
-        from PIL import Image
-        import io
-        import re
-        
+        pytesseract, Image, ImageOps = _get_ocr_modules()
+
         print(f"📸 Processing image for {home_team_name} vs {away_team_name}...")
-        
+
         try:
             # 1. Load Image
             img = Image.open(io.BytesIO(image_bytes))
+
+            # 1b. Preprocess for OCR speed/accuracy: grayscale, downscale
+            # phone captures to ~1500px on the long edge (Tesseract's LSTM
+            # pass is area-bound), autocontrast, then binarize — lineup
+            # cards are text on flat backgrounds, so a mean threshold holds
+            img = img.convert('L')
+            if max(img.size) > 1500:
+                img.thumbnail((1500, 1500), Image.LANCZOS)
+            img = ImageOps.autocontrast(img)
+            arr = np.array(img)
+            img = Image.fromarray(((arr > arr.mean()).astype('uint8')) * 255)
+
+            # 2. OCR Extraction (--psm 6: single text block, skips the
+            # multi-orientation/paragraph analysis passes; --oem 1: LSTM only)
+            text = pytesseract.image_to_string(img, lang='spa+eng', config='--psm 6 --oem 1')
             
-            # 2. OCR Extraction
-            text = pytesseract.image_to_string(img, lang='spa+eng')
-            
-            # 3. Text Cleaning & Name Extraction
-            lines = text.split('\n')
-            extracted_names = set()
-            
-            for line in lines:
-                clean = line.strip()
-                # Basic name filter: at least 2 words, no numbers/symbols
-                if len(clean.split()) >= 2 and re.match(r'^[A-Z][a-z\u00C0-\u017F]+(?:\s[A-Z][a-z\u00C0-\u017F]+)+$', clean):
-                    extracted_names.add(clean)
-                else:
-                    # Fallback: look for names within line
-                    matches = re.findall(r'([A-Z][a-z\u00C0-\u017F]+(?:\s[A-Z][a-z\u00C0-\u017F]+)+)', clean)
-                    for m in matches:
-                        extracted_names.add(m)
+            # 3. Name Extraction: one scan over the whole OCR text instead of
+            # matching every line twice (the pattern also covers full-line names)
+            extracted_names = set(_OCR_ANY_RE.findall(text))
 
             if not extracted_names:
                 # Last resort: just get all words and try fuzzy matching later
-                words = re.findall(r'\b[A-Z][a-z\u00C0-\u017F]+\b', text)
+                words = _OCR_WORD_RE.findall(text)
                 extracted_names = set(words)
 
         except Exception as e:
@@ -339,31 +593,27 @@ class LineupFetcher:
         found_home = []
         found_away = []
         
-        team_home = self.data_provider.get_team_data(home_team_name)
-        team_away = self.data_provider.get_team_data(away_team_name)
-        
-        def fuzzy_match(scraped_name, roster):
-            scraped_tokens = set(scraped_name.lower().split())
-            if not scraped_tokens: return None
-            for p in roster:
-                p_tokens = set(p.name.lower().split())
-                if p_tokens.issubset(scraped_tokens) or scraped_tokens.issubset(p_tokens):
-                    return p.name
-                if len(scraped_tokens.intersection(p_tokens)) >= 1:
-                    return p.name
-            return None
+        team_home, home_idx = self._get_roster_tokens(home_team_name)
+        team_away, away_idx = self._get_roster_tokens(away_team_name)
+
+        # Normalize + dedupe near-duplicate candidates, tokenize each one
+        # once, then run one combined pass that stops as soon as both
+        # starting XIs are filled (OCR pages can emit 40-80 noisy strings)
+        normalized = {_normalize_name(name) for name in extracted_names if len(name) > 2}
+        normalized.discard('')
+        scraped_tokens = [name.lower().split() for name in normalized]
 
-        if team_home:
-            for scraped in extracted_names:
-                match = fuzzy_match(scraped, team_home.players)
+        for tokens in scraped_tokens:
+            if team_home and len(found_home) < 11:
+                match = self._fuzzy_match(tokens, home_idx)
                 if match and match not in found_home:
                     found_home.append(match)
-                    
-        if team_away:
-            for scraped in extracted_names:
-                match = fuzzy_match(scraped, team_away.players)
+            if team_away and len(found_away) < 11:
+                match = self._fuzzy_match(tokens, away_idx)
                 if match and match not in found_away:
                     found_away.append(match)
+            if len(found_home) >= 11 and len(found_away) >= 11:
+                break
         
         if not found_home and not found_away:
              return {"error": "No se reconocieron nombres de jugadores conocidos en la imagen.", "home": [], "away": []}
@@ -1,41 +1,50 @@
 import math
 from typing import Dict, Tuple
+import numpy as np
 from src.models.base import Team
 
 class PoissonEngine:
     """
-    Motor estadístico basado en la distribución de Poisson para predecir 
+    Motor estadístico basado en la distribución de Poisson para predecir
     resultados de fútbol mediante fuerza ofensiva y defensiva.
     """
-    
+
     def calculate_poisson_probability(self, lambda_val: float, k: int) -> float:
         """Calcula P(X=k) dado un parámetro lambda."""
         if lambda_val <= 0: return 0.0 if k > 0 else 1.0
         return (math.exp(-lambda_val) * (lambda_val**k)) / math.factorial(k)
 
+    def predict_score_array(self, home_lambda: float, away_lambda: float, max_goals: int = 5) -> np.ndarray:
+        """
+        Matriz (goles_local, goles_visitante) de probabilidades exactas como
+        ndarray: una multiplicación exterior de las dos PMFs en lugar de
+        (max_goals+1)^2 llamadas escalares.
+        """
+        goals = np.arange(max_goals + 1)
+        factorials = np.array([math.factorial(k) for k in goals], dtype=float)
+        pmf_home = np.exp(-home_lambda) * home_lambda ** goals / factorials
+        pmf_away = np.exp(-away_lambda) * away_lambda ** goals / factorials
+        return np.outer(pmf_home, pmf_away)
+
+    @staticmethod
+    def encode_score_matrix(arr: np.ndarray) -> Dict[str, float]:
+        """Serializa la matriz ndarray al formato {'h-a': prob} de la API."""
+        rounded = np.round(arr, 4)
+        return {f"{h}-{a}": float(rounded[h, a])
+                for h in range(arr.shape[0]) for a in range(arr.shape[1])}
+
     def predict_score_matrix(self, home_lambda: float, away_lambda: float, max_goals: int = 5) -> Dict[str, float]:
         """Genera una matriz de probabilidades para resultados exactos."""
-        matrix = {}
-        for h in range(max_goals + 1):
-            for a in range(max_goals + 1):
-                prob_h = self.calculate_poisson_probability(home_lambda, h)
-                prob_a = self.calculate_poisson_probability(away_lambda, a)
-                matrix[f"{h}-{a}"] = round(prob_h * prob_a, 4)
-        return matrix
+        return self.encode_score_matrix(self.predict_score_array(home_lambda, away_lambda, max_goals))
 
     def calculate_match_probabilities(self, home_lambda: float, away_lambda: float) -> Tuple[float, float, float]:
         """Calcula probabilidades 1X2 basándose en el modelo Poisson."""
-        matrix = self.predict_score_matrix(home_lambda, away_lambda, max_goals=8)
-        prob_home = 0.0
-        prob_draw = 0.0
-        prob_away = 0.0
-        
-        for score, prob in matrix.items():
-            h, a = map(int, score.split("-"))
-            if h > a: prob_home += prob
-            elif h == a: prob_draw += prob
-            else: prob_away += prob
-            
+        arr = self.predict_score_array(home_lambda, away_lambda, max_goals=8)
+        # Filas = goles local: triángulo inferior gana el local
+        prob_home = float(np.tril(arr, -1).sum())
+        prob_draw = float(np.trace(arr))
+        prob_away = float(np.triu(arr, 1).sum())
+
         return round(prob_home, 4), round(prob_draw, 4), round(prob_away, 4)
 
     def estimate_lambdas(self, home_team: Team, away_team: Team, league_avg_goals: float = 1.35, home_bpa: float = 0.5, away_bpa: float = 0.5) -> Tuple[float, float]:
@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from src.models.base import Match, PredictionResult
 from src.logic.bpa_engine import BPAEngine
@@ -31,34 +32,44 @@ class Predictor:
 
         # 3. Poisson Statistics (Goals & Lambdas con Integración BPA)
         h_lambda, a_lambda = self.poisson.estimate_lambdas(match.home_team, match.away_team, home_bpa=bpa_h, away_bpa=bpa_a)
-        p_matrix = self.poisson.predict_score_matrix(h_lambda, a_lambda)
+        p_array = self.poisson.predict_score_array(h_lambda, a_lambda)
+        p_matrix = self.poisson.encode_score_matrix(p_array)
         p_home, p_draw, p_away = self.poisson.calculate_match_probabilities(h_lambda, a_lambda)
 
         # 4. Machine Learning (Ensemble classification)
         ml_probs = self.ml.predict_probabilities(None) 
 
-        # 5. Hybrid Blending (Fusión de modelos)
-        final_home = (ml_probs['LOCAL'] * 0.4) + (p_home * 0.4) + (0.35 + (bpa_h - bpa_a) * 0.2)
-        final_draw = (ml_probs['EMPATE'] * 0.4) + (p_draw * 0.4) + (0.30)
-        final_away = (ml_probs['VISITANTE'] * 0.4) + (p_away * 0.4) + (0.35 - (bpa_h - bpa_a) * 0.2)
-        
+        # 5. Hybrid Blending (Fusión de modelos) — the three model
+        # distributions stacked as rows (ML, Poisson, BPA bias) and fused in
+        # one weighted matrix product
+        bpa_edge = (bpa_h - bpa_a) * 0.2
+        stacked = np.array([
+            [ml_probs['LOCAL'], ml_probs['EMPATE'], ml_probs['VISITANTE']],
+            [p_home, p_draw, p_away],
+            [0.35 + bpa_edge, 0.30, 0.35 - bpa_edge],
+        ])
+        weights = np.array([0.4, 0.4, 1.0])
+        final_home, final_draw, final_away = weights @ stacked
+
         # Normalize
         total = final_home + final_draw + final_away
         
         stats = self.external_analyst.calculate_stat_markets(match, bpa_h, bpa_a)
         
-        # Determine the most likely score
-        score_pred = "0-0"
-        if p_matrix:
-            score_pred = max(p_matrix, key=p_matrix.get)
+        # Determine the most likely score (argmax over the raw array)
+        h_idx, a_idx = np.unravel_index(np.argmax(p_array), p_array.shape)
+        score_pred = f"{h_idx}-{a_idx}"
 
-        pred = PredictionResult(
+        # All fields here are trusted internal values, so skip Pydantic
+        # validation via model_construct (the floats are cast explicitly
+        # since no coercion runs).
+        pred = PredictionResult.model_construct(
             match_id=match.id,
-            bpa_home=bpa_h,
-            bpa_away=bpa_a,
-            win_prob_home=round(final_home/total, 4),
-            draw_prob=round(final_draw/total, 4),
-            win_prob_away=round(final_away/total, 4),
+            bpa_home=float(bpa_h),
+            bpa_away=float(bpa_a),
+            win_prob_home=round(float(final_home/total), 4),
+            draw_prob=round(float(final_draw/total), 4),
+            win_prob_away=round(float(final_away/total), 4),
             poisson_matrix=p_matrix,
             total_goals_expected=round(h_lambda + a_lambda, 2),
             both_teams_to_score_prob=round(1.0 - (self.poisson.calculate_poisson_probability(h_lambda, 0) * self.poisson.calculate_poisson_probability(a_lambda, 0)), 4),
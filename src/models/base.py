@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
@@ -136,9 +137,11 @@ class PredictionResult(BaseModel):
     external_analysis_summary: str = ""
     referee_name: str = "Autodetectado"
 
-class MatchOutcome(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="ignore")
-    
+# Plain slotted dataclass: outcomes are built in bulk during backtests and
+# training from already-trusted values, never serialized, so they skip the
+# Pydantic validation and __dict__ overhead of the wire models above.
+@dataclass(slots=True)
+class MatchOutcome:
     match_id: str
     home_score: int
     away_score: int
@@ -148,6 +151,6 @@ class MatchOutcome(BaseModel):
     away_cards: int
     home_shots: int
     away_shots: int
+    actual_winner: str # "LOCAL", "VISITANTE", "EMPATE"
     home_shots_on_target: int = 0
     away_shots_on_target: int = 0
-    actual_winner: str # "LOCAL", "VISITANTE", "EMPATE"